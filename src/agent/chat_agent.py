@@ -1,19 +1,96 @@
 # src/agent/chat_agent.py
 from __future__ import annotations
 
-from typing import TypedDict, List, Annotated, Dict
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, AIMessage, ToolMessage
-from langgraph.graph import StateGraph
-from langgraph.checkpoint.memory import MemorySaver
-from langgraph.graph.message import add_messages
-from dotenv import load_dotenv
+from typing import TypedDict, Annotated, Callable, Dict, cast
+from langchain_core.messages import BaseMessage, RemoveMessage, convert_to_messages
+from langgraph.graph.message import REMOVE_ALL_MESSAGES, Messages, add_messages
 
-load_dotenv()
+from src.schemas.document import Document
 
+# ChatState가 보관하는 기본 최대 메시지 수 (선두 system 메시지 제외)
+DEFAULT_MAX_HISTORY_MESSAGES = 50
 
+
+def init() -> None:
+    """
+    Load environment variables (API keys, etc.) from `.env`.
+
+    Call once at application start-up instead of at import time.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def bounded_add_messages(
+    max_messages: int,
+) -> Callable[[Messages, Messages], list[BaseMessage]]:
+    """
+    Build an `add_messages` reducer that keeps a bounded message history.
+
+    Merging (id-based updates, RemoveMessage) is delegated to `add_messages`;
+    the result is then trimmed to the last `max_messages` messages, not
+    counting leading system messages, which are always kept. Messages
+    appended by the current update are never evicted, so a large initial
+    input is kept as-is. Tool results left at the front of the older
+    history without their originating tool call are dropped as well.
+
+    To use a different limit, annotate a state's `messages` with
+    `Annotated[list[BaseMessage], bounded_add_messages(n)]`.
+    """
+    if max_messages < 1:
+        raise ValueError("max_messages must be at least 1")
+
+    def merge_messages(left: Messages, right: Messages) -> list[BaseMessage]:
+        history = convert_to_messages(left if isinstance(left, list) else [left])
+        updates = convert_to_messages(right if isinstance(right, list) else [right])
+
+        # Removing a message that was already evicted is a no-op
+        if any(isinstance(m, RemoveMessage) for m in updates):
+            known = {m.id for m in history}
+            updates = [
+                m
+                for m in updates
+                if not isinstance(m, RemoveMessage)
+                or m.id == REMOVE_ALL_MESSAGES
+                or m.id in known
+            ]
+
+        merged = cast(
+            list[BaseMessage],
+            add_messages(cast(Messages, history), cast(Messages, updates)),
+        )
+
+        # Only appended messages count as new; replacements keep an old id.
+        # `add_messages` has assigned ids to the history by now.
+        old_ids = {m.id for m in history}
+        n_new = sum(1 for m in merged if m.id not in old_ids)
+
+        n_system = 0
+        while n_system < len(merged) and merged[n_system].type == "system":
+            n_system += 1
+
+        keep = max(max_messages, n_new)
+        if len(merged) - n_system <= keep:
+            return merged
+
+        # Skip orphaned tool results, but never into the current update
+        start = len(merged) - keep
+        first_new = len(merged) - n_new
+        while start < first_new and merged[start].type == "tool":
+            start += 1
+        return merged[:n_system] + merged[start:]
+
+    return merge_messages
+
+
+merge_messages = bounded_add_messages(DEFAULT_MAX_HISTORY_MESSAGES)
+
+
+# State schema는 TypedDict로 유지하고 validator를 추가하지 않는다.
+# (Pydantic 기반 state는 LangGraph가 매 노드 전이마다 전체 검증을 수행한다)
 class ChatState(TypedDict):
-    messages: Annotated[list[BaseMessage], add_messages]
+    messages: Annotated[list[BaseMessage], merge_messages]
 
-    # 만들어진 문서
-    docs: Dict
+    # 만들어진 문서 (doc_id 문자열 -> Document)
+    docs: Dict[str, Document]
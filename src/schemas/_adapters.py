@@ -0,0 +1,32 @@
+# src/schemas/_adapters.py
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from src.schemas.document import Document
+from src.schemas.template import Template
+from src.schemas.validation import ValidationIssue, ValidationResult
+
+
+@lru_cache(maxsize=None)
+def adapter_for(tp: Any) -> TypeAdapter[Any]:
+    """
+    Return a cached TypeAdapter for the given type.
+
+    Building a TypeAdapter constructs a pydantic core schema, so ad-hoc
+    adapters should be obtained here instead of being created per call.
+    """
+    return TypeAdapter(tp)
+
+
+# Shared adapters for (de)serializing schema payloads
+DOCUMENT_ADAPTER: TypeAdapter[Document] = adapter_for(Document)
+DOCUMENT_LIST_ADAPTER: TypeAdapter[list[Document]] = adapter_for(list[Document])
+TEMPLATE_ADAPTER: TypeAdapter[Template] = adapter_for(Template)
+VALIDATION_RESULT_ADAPTER: TypeAdapter[ValidationResult] = adapter_for(ValidationResult)
+ISSUE_LIST_ADAPTER: TypeAdapter[list[ValidationIssue]] = adapter_for(
+    list[ValidationIssue]
+)
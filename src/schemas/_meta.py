@@ -0,0 +1,68 @@
+# src/schemas/_meta.py
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from pydantic import BaseModel, BeforeValidator, Field
+from typing import Annotated, Any
+
+
+def _to_epoch(value: Any) -> Any:
+    """
+    Convert datetimes and ISO-8601 strings to UNIX epoch seconds.
+
+    Keeps payloads written before timestamps were stored as floats loading.
+    Naive datetimes are taken as UTC. Anything else is left for the float
+    validator.
+    """
+    if isinstance(value, str):
+        try:
+            float(value)
+            return value
+        except ValueError:
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return value
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return value
+
+
+# Epoch-second timestamp that also accepts datetime / ISO-8601 input
+EpochSeconds = Annotated[float, BeforeValidator(_to_epoch)]
+
+
+class TimestampedMeta(BaseModel):
+    """
+    Base for metadata models that track creation and update times.
+
+    Timestamps are stored as UNIX epoch seconds, which are cheaper to create
+    and (de)serialize than datetimes; the `*_dt` properties convert on demand.
+    """
+
+    created_at: EpochSeconds = Field(
+        default_factory=time.time,
+        description="Creation time as UNIX epoch seconds (UTC)",
+    )
+    # Defaults to `created_at`, so new metadata takes a single clock read
+    updated_at: EpochSeconds = Field(
+        default_factory=lambda data: data["created_at"],
+        description="Last update time as UNIX epoch seconds (UTC)",
+    )
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """
+        Return `created_at` as an aware UTC datetime.
+        """
+        return datetime.fromtimestamp(self.created_at, tz=timezone.utc)
+
+    @property
+    def updated_at_dt(self) -> datetime:
+        """
+        Return `updated_at` as an aware UTC datetime.
+        """
+        return datetime.fromtimestamp(self.updated_at, tz=timezone.utc)
@@ -1,16 +1,18 @@
 # src/schemas/document.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Any, Dict, Literal, Optional
+import time
+from typing import Any, Dict, Iterable, Literal, Optional, Sequence
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.schemas._meta import TimestampedMeta
+
 DocumentStatus = Literal["draft", "validated", "final"]
 
 
-class DocumentMeta(BaseModel):
+class DocumentMeta(TimestampedMeta):
     """
     Metadata associated with a Document.
 
@@ -18,14 +20,6 @@ class DocumentMeta(BaseModel):
     and collaboration-related data.
     """
 
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="UTC creation time",
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="UTC last update time",
-    )
     author: Optional[str] = Field(
         default=None,
         description="Primary author of the document",
@@ -74,10 +68,46 @@ class Document(BaseModel):
         description="Current lifecycle status of the document",
     )
 
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> Document:
+        """
+        Build a Document from trusted data without running validation.
+
+        Intended for bulk loads from internal sources such as a database
+        or cache. Values must already have their final types
+        (e.g. `doc_id` as a UUID).
+        """
+        metadata = data.get("metadata")
+        if isinstance(metadata, dict):
+            data = {**data, "metadata": DocumentMeta.model_construct(**metadata)}
+        return cls.model_construct(**data)
+
+    def field_values(self, names: Sequence[str]) -> tuple[Any, ...]:
+        """
+        Return field values aligned positionally with `names`.
+
+        Pass `template.slot_names()` to walk a document against the
+        template's slots by position instead of looking each one up.
+        Missing fields are returned as None.
+        """
+        return tuple(map(self.fields.get, names))
+
     def touch(self) -> None:
         """
         Update the document's `updated_at` timestamp.
 
         Should be called whenever the document content or metadata changes.
         """
-        self.metadata.updated_at = datetime.now(timezone.utc)
+        self.metadata.updated_at = time.time()
+
+    @classmethod
+    def touch_many(cls, docs: Iterable[Document]) -> None:
+        """
+        Update the `updated_at` timestamp of several documents at once.
+
+        The current time is read once and shared by all documents,
+        which keeps bulk updates consistent and cheap.
+        """
+        now = time.time()
+        for doc in docs:
+            doc.metadata.updated_at = now
@@ -1,14 +1,29 @@
 # src/schemas/template.py
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from pydantic import BaseModel, Field
-from typing import Literal, Optional
+import sys
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, Optional, Self
+
+from src.schemas._meta import TimestampedMeta
 
 SlotType = Literal["string", "number", "boolean", "list_string"]
 
+# Names of the cached slot views on Template, dropped by `Template.model_copy`
+_SLOT_VIEWS = ("_slot_names", "_required_names", "_required_name_set", "_slot_map")
+
+# Value validators for each slot type, built once at import
+_SLOT_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    "string": TypeAdapter(str),
+    "number": TypeAdapter(float),
+    "boolean": TypeAdapter(bool),
+    "list_string": TypeAdapter(list[str]),
+}
 
-class TemplateMeta(BaseModel):
+
+class TemplateMeta(TimestampedMeta):
     """
     Metadata associated with a Template.
 
@@ -16,14 +31,6 @@ class TemplateMeta(BaseModel):
     that is not directly tied to the template's content or structure.
     """
 
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="UTC creation time",
-    )
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="UTC last update time",
-    )
     author: Optional[str] = Field(
         default=None,
         description="Primary author of the template",
@@ -40,8 +47,11 @@ class TemplateSlot(BaseModel):
 
     Each slot represents one piece of structured input that the user
     must (or may) provide when instantiating the template.
+    Slots are immutable so that a Template's cached slot views stay valid.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         ...,
         description="Unique slot identifier within the template",
@@ -63,6 +73,16 @@ class TemplateSlot(BaseModel):
         description="Example value used for prompting or UI hints",
     )
 
+    @property
+    def validator(self) -> TypeAdapter[Any]:
+        """
+        Return the shared value validator for this slot's type.
+
+        Use `slot.validator.validate_python(value)` to check or coerce
+        a document field value.
+        """
+        return _SLOT_ADAPTERS[self.type]
+
 
 class Template(BaseModel):
     """
@@ -72,8 +92,14 @@ class Template(BaseModel):
     - its identity and version
     - a set of input slots required to generate a document
     - metadata for auditing and collaboration
+
+    Templates are immutable once built, so views derived from `slots` are
+    computed on first use and cached. Use `model_copy(update=...)` to
+    derive a modified template.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     template_id: str = Field(
         ...,
         description="Unique, stable identifier for the template",
@@ -95,19 +121,68 @@ class Template(BaseModel):
         description="Metadata associated with the template",
     )
 
-    def required_slots(self) -> list[str]:
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        """
+        Copy the template, dropping cached slot views.
+
+        The views are rebuilt from the copy's own `slots` on first use.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _SLOT_VIEWS:
+            copied.__dict__.pop(name, None)
+        return copied
+
+    @cached_property
+    def _slot_names(self) -> tuple[str, ...]:
+        return tuple(sys.intern(s.name) for s in self.slots)
+
+    @cached_property
+    def _required_names(self) -> tuple[str, ...]:
+        return tuple(s.name for s in self.slots if s.required)
+
+    @cached_property
+    def _required_name_set(self) -> frozenset[str]:
+        return frozenset(self._required_names)
+
+    @cached_property
+    def _slot_map(self) -> dict[str, TemplateSlot]:
+        return {s.name: s for s in self.slots}
+
+    def slot_names(self) -> tuple[str, ...]:
+        """
+        Return the names of all slots, in slot order.
+
+        The tuple is shared by every document built from this template and
+        is aligned positionally with `slots`; see `Document.field_values`.
         """
-        Return the names of all required slots.
+        return self._slot_names
+
+    def required_slots(self) -> tuple[str, ...]:
+        """
+        Return the names of all required slots, in slot order.
 
         Useful for validating user input against the template definition.
+        The tuple is built once and returned as-is on later calls.
+        """
+        return self._required_names
+
+    def required_slot_set(self) -> frozenset[str]:
         """
-        return [s.name for s in self.slots if s.required]
+        Return the names of all required slots as a frozenset.
 
-    def slot_map(self) -> dict[str, TemplateSlot]:
+        Enables set-based checks against document fields, e.g.
+        `template.required_slot_set() - doc.fields.keys()` yields the
+        missing required slots.
         """
-        Return a mapping of slot name to TemplateSlot definition.
+        return self._required_name_set
+
+    def slot_map(self) -> Mapping[str, TemplateSlot]:
+        """
+        Return a read-only mapping of slot name to TemplateSlot definition.
 
         Enables fast lookup of slot metadata during validation
         or document generation.
         """
-        return {s.name: s for s in self.slots}
+        return MappingProxyType(self._slot_map)
@@ -1,11 +1,14 @@
 # src/schemas/validation.py
 from __future__ import annotations
 
-from enum import Enum
-from pydantic import BaseModel, Field, model_validator
+import sys
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Annotated, Any, Iterable, Iterator
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
 
 
-class Severity(str, Enum):
+class Severity(StrEnum):
     """
     Severity level of a validation issue.
 
@@ -19,41 +22,73 @@ class Severity(str, Enum):
     info = "info"
 
 
-class ValidationIssue(BaseModel):
+# Canonical messages for common issues, shared by every issue that uses them
+_MESSAGE_TEMPLATES: dict[str, str] = {
+    "missing": "Required field is missing",
+}
+
+
+def _intern_str(value: Any) -> Any:
+    """
+    Intern string input so repeated field names share storage.
+
+    Only applied when pydantic validates incoming payloads (JSON,
+    `ISSUE_LIST_ADAPTER`, `ValidationResult.model_validate`); direct
+    construction of a ValidationIssue skips it.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationIssue:
     """
     Represents a single validation issue detected during document validation.
 
-    This model is used for missing fields, validation errors, and warnings,
+    This type is used for missing fields, validation errors, and warnings,
     and can be aggregated into a ValidationResult.
+
+    Issues are created in bulk, so this is a lightweight frozen dataclass
+    rather than a BaseModel. Instances are hashable and can be deduplicated
+    with a set. Direct construction performs no validation; pydantic only
+    validates issues given as dict/JSON input (e.g. to
+    `ValidationResult.model_validate` or `ISSUE_LIST_ADAPTER`). Existing
+    ValidationIssue instances are accepted as-is.
     """
 
-    field_name: str = Field(
-        ...,
-        description="Name of the field associated with the validation issue",
-    )
-    message: str = Field(
-        ...,
-        description="Human-readable description of the validation issue",
-    )
-    severity: Severity = Field(
-        ...,
-        description="Severity level of the issue (error, warning, info)",
-    )
+    field_name: Annotated[
+        str,
+        Field(description="Name of the field associated with the validation issue"),
+        BeforeValidator(_intern_str),
+    ]
+    message: Annotated[
+        str,
+        Field(description="Human-readable description of the validation issue"),
+    ]
+    severity: Annotated[
+        Severity,
+        Field(description="Severity level of the issue (error, warning, info)"),
+    ]
+
+    @classmethod
+    def missing_field(cls, field_name: str) -> ValidationIssue:
+        """
+        Create an error issue for a required field that is missing.
+        """
+        return cls(field_name, _MESSAGE_TEMPLATES["missing"], Severity.error)
 
 
 class ValidationResult(BaseModel):
     """
     Aggregated result of validating a document against a template or schema.
 
-    - `valid` is a derived field and is automatically synchronized based on issues.
+    - `valid` is a computed field derived from the issues on every access.
     - Missing fields and errors invalidate the document.
     - Warnings do not affect validity.
     """
 
-    valid: bool = Field(
-        default=True,
-        description="Whether the document is considered valid",
-    )
+    # Results are built up incrementally; mutating the issue lists or
+    # calling `model_copy(update=...)` must not trigger re-validation.
+    model_config = ConfigDict(frozen=False, validate_assignment=False)
 
     # Fields that are required but missing from the document
     missing: list[ValidationIssue] = Field(
@@ -73,10 +108,11 @@ class ValidationResult(BaseModel):
         description="List of validation warnings",
     )
 
-    @model_validator(mode="after")
-    def _sync_valid(self) -> "ValidationResult":
+    @computed_field(description="Whether the document is considered valid")
+    @property
+    def valid(self) -> bool:
         """
-        Synchronize the `valid` field based on validation issues.
+        Whether the document is considered valid.
 
         A document is considered valid if and only if:
         - there are no missing required fields
@@ -84,8 +120,37 @@ class ValidationResult(BaseModel):
 
         Warnings do not affect validity.
         """
-        self.valid = len(self.missing) == 0 and len(self.errors) == 0
-        return self
+        return not self.missing and not self.errors
+
+    @classmethod
+    def from_issues(
+        cls,
+        missing: Iterable[ValidationIssue] = (),
+        errors: Iterable[ValidationIssue] = (),
+        warnings: Iterable[ValidationIssue] = (),
+    ) -> ValidationResult:
+        """
+        Build a result from internally generated issues without re-validation.
+
+        Uses `model_construct`, so the issues must already be
+        ValidationIssue instances.
+        """
+        return cls.model_construct(
+            missing=list(missing),
+            errors=list(errors),
+            warnings=list(warnings),
+        )
+
+    def iter_issues(self) -> Iterator[ValidationIssue]:
+        """
+        Iterate over all validation issues without building a new list.
+
+        Prefer this over `all_issues()` when the issues are only traversed
+        once, e.g. for logging or counting.
+        """
+        yield from self.missing
+        yield from self.errors
+        yield from self.warnings
 
     def all_issues(self) -> list[ValidationIssue]:
         """
@@ -93,10 +158,10 @@ class ValidationResult(BaseModel):
 
         Useful for unified rendering, logging, or reporting.
         """
-        return self.missing + self.errors + self.warnings
+        return list(self.iter_issues())
 
-    def missing_field_names(self) -> list[str]:
+    def missing_field_names(self) -> tuple[str, ...]:
         """
         Return the names of all missing required fields.
         """
-        return [issue.field_name for issue in self.missing]
+        return tuple(issue.field_name for issue in self.missing)
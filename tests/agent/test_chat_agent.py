@@ -0,0 +1,85 @@
+# tests/agent/test_chat_agent.py
+import pytest
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
+
+from src.agent.chat_agent import bounded_add_messages
+
+
+def human(i: int) -> HumanMessage:
+    return HumanMessage(str(i), id=str(i))
+
+
+def ids(messages: list) -> list:
+    return [m.id for m in messages]
+
+
+def test_keeps_last_messages_within_limit() -> None:
+    merge = bounded_add_messages(3)
+    merged = merge([human(i) for i in range(3)], [human(3)])
+    assert ids(merged) == ["1", "2", "3"]
+
+
+def test_leading_system_message_is_kept_and_not_counted() -> None:
+    merge = bounded_add_messages(4)
+    history = [SystemMessage("s", id="s")] + [human(i) for i in range(1, 5)]
+
+    assert ids(merge([], history)) == ["s", "1", "2", "3", "4"]
+    assert ids(merge(history, [human(5)])) == ["s", "2", "3", "4", "5"]
+
+
+def test_current_update_is_never_evicted() -> None:
+    merge = bounded_add_messages(4)
+    merged = merge([], [human(i) for i in range(10)])
+    assert len(merged) == 10
+
+
+def test_removals_and_replacements_do_not_count_as_new() -> None:
+    merge = bounded_add_messages(2)
+    update = [RemoveMessage(id="1"), human(3), human(4)]
+    assert ids(merge([human(1), human(2)], update)) == ["3", "4"]
+
+    replaced = merge([human(1), human(2)], [HumanMessage("x", id="1"), human(3)])
+    assert ids(replaced) == ["2", "3"]
+
+
+def test_remove_of_evicted_message_is_ignored() -> None:
+    merge = bounded_add_messages(2)
+    history = merge([human(1), human(2)], [human(3)])
+    assert ids(history) == ["2", "3"]
+
+    assert ids(merge(history, [RemoveMessage(id="1")])) == ["2", "3"]
+    assert ids(merge(history, [RemoveMessage(id="2")])) == ["3"]
+
+
+def test_remove_all_messages_clears_history() -> None:
+    merge = bounded_add_messages(2)
+    update = [RemoveMessage(id=REMOVE_ALL_MESSAGES), human(9)]
+    assert ids(merge([human(1), human(2)], update)) == ["9"]
+
+
+def test_orphaned_leading_tool_result_is_dropped() -> None:
+    merge = bounded_add_messages(2)
+    history = [
+        human(1),
+        AIMessage("", id="a", tool_calls=[{"name": "t", "args": {}, "id": "c"}]),
+        ToolMessage("r", tool_call_id="c", id="t"),
+    ]
+    assert ids(merge(history, [human(2)])) == ["2"]
+
+
+def test_tool_skip_does_not_drop_the_update() -> None:
+    merge = bounded_add_messages(1)
+    update = ToolMessage("r", tool_call_id="x", id="t")
+    assert ids(merge([HumanMessage("q", id="q")], [update])) == ["t"]
+
+
+def test_rejects_non_positive_limit() -> None:
+    with pytest.raises(ValueError):
+        bounded_add_messages(0)